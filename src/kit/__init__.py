@@ -2,27 +2,61 @@
 A modular toolkit for LLM-powered codebase understanding.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 __author__ = "cased"
 __version__ = "0.7.2"
 
-from .code_searcher import CodeSearcher
-from .context_extractor import ContextExtractor
-from .docstring_indexer import DocstringIndexer, SummarySearcher
-from .llm_context import ContextAssembler
-from .repo_mapper import RepoMapper
-from .repository import Repository
-from .tree_sitter_symbol_extractor import TreeSitterSymbolExtractor
-from .vector_searcher import VectorSearcher
-
-try:
+# Public name -> defining submodule. Attributes are resolved on first access
+# (PEP 562) so `import kit` — and in particular CLI cold start — doesn't pay
+# for every subsystem (tree-sitter, vector search, LLM clients) up front.
+_LAZY_ATTRS = {
+    "CodeSearcher": "code_searcher",
+    "ContextExtractor": "context_extractor",
+    "DocstringIndexer": "docstring_indexer",
+    "SummarySearcher": "docstring_indexer",
+    "ContextAssembler": "llm_context",
+    "RepoMapper": "repo_mapper",
+    "Repository": "repository",
+    "TreeSitterSymbolExtractor": "tree_sitter_symbol_extractor",
+    "VectorSearcher": "vector_searcher",
+    # LLM extras: importing these raises ImportError when the optional
+    # dependencies aren't installed, but only once they're actually used.
+    "Summarizer": "summaries",
+    "AnthropicConfig": "summaries",
+    "GoogleConfig": "summaries",
+    "LLMError": "summaries",
+    "OpenAIConfig": "summaries",
+    # Helper for LLM tool schemas
+    "get_tool_schemas": "tool_schemas",
+}
+
+if TYPE_CHECKING:
+    from .code_searcher import CodeSearcher
+    from .context_extractor import ContextExtractor
+    from .docstring_indexer import DocstringIndexer, SummarySearcher
+    from .llm_context import ContextAssembler
+    from .repo_mapper import RepoMapper
+    from .repository import Repository
     from .summaries import AnthropicConfig, GoogleConfig, LLMError, OpenAIConfig, Summarizer
-except ImportError:
-    # Allow kit to be imported even if LLM extras aren't installed.
-    # Users will get an ImportError later if they try to use Summarizer.
-    pass
+    from .tool_schemas import get_tool_schemas
+    from .tree_sitter_symbol_extractor import TreeSitterSymbolExtractor
+    from .vector_searcher import VectorSearcher
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Cache so subsequent accesses skip this hook.
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
-# Helper for LLM tool schemas
-from .tool_schemas import get_tool_schemas
 
 # Compatibility patch for Click ≥ 8.2 breaking Typer ≤ 0.15
 # -----------------------------------------------------------------------------
@@ -93,21 +127,19 @@ except Exception:  # pragma: no cover – best-effort patch, never fail hard
     pass
 
 __all__ = [
-    "Repository",
-    "RepoMapper",
+    "AnthropicConfig",
     "CodeSearcher",
+    "ContextAssembler",
     "ContextExtractor",
-    "VectorSearcher",
     "DocstringIndexer",
+    "GoogleConfig",
+    "LLMError",
+    "OpenAIConfig",
+    "RepoMapper",
+    "Repository",
+    "Summarizer",
     "SummarySearcher",
-    "ContextAssembler",
-    "DependencyAnalyzer",
     "TreeSitterSymbolExtractor",
+    "VectorSearcher",
     "get_tool_schemas",
-    # Conditionally add Summarizer related classes if they were imported
-    *(
-        ["Summarizer", "OpenAIConfig", "AnthropicConfig", "GoogleConfig", "LLMError"]
-        if "Summarizer" in globals()
-        else []
-    ),
 ]
@@ -0,0 +1,76 @@
+"""Shared stripping of reasoning-model "thinking" tags from LLM output."""
+
+import re
+from functools import lru_cache
+
+# Opener/closer pairs for thinking-tag blocks emitted by reasoning models
+# (DeepSeek R1 and friends). strip_thinking_tokens removes them with a
+# str.find scan, so the regex engine never touches (and never backtracks
+# over) arbitrarily long model output.
+_THINKING_TAG_PAIRS = tuple((f"<{tag}>", f"</{tag}>") for tag in ("think", "thinking", "thought", "reason"))
+_EXTRA_BLANK_LINES_RE = re.compile(r"\n\s*\n\s*\n")
+
+# Responses are cached whole, so bound entry size as well as entry count.
+_STRIP_CACHE_MAX_LEN = 64_000
+
+
+def strip_thinking_tokens(response: str) -> str:
+    """
+    Strip thinking tokens from LLM responses.
+
+    Reasoning models like DeepSeek R1 include <think>...</think> tags
+    that show internal reasoning but aren't meant for end users.
+
+    The scan is plain substring search, so runtime stays linear even on
+    malformed input — an opening tag that never closes (e.g. a truncated
+    response) is left in place rather than triggering the quadratic
+    backtracking a non-greedy ``.*?`` regex would exhibit there.
+
+    The same text is often stripped more than once (displayed, posted,
+    saved), so results for reasonably sized responses are memoized.
+    """
+    if not response:
+        return response
+    if len(response) < _STRIP_CACHE_MAX_LEN:
+        return _strip_thinking_tokens_cached(response)
+    return _strip_thinking_tokens_uncached(response)
+
+
+@lru_cache(maxsize=128)
+def _strip_thinking_tokens_cached(response: str) -> str:
+    return _strip_thinking_tokens_uncached(response)
+
+
+def _strip_thinking_tokens_uncached(response: str) -> str:
+    # Tags are matched case-insensitively against a lowered copy while
+    # slices come from the original, preserving the surviving text exactly.
+    lowered = response.lower()
+
+    # Fast path: most model output contains no thinking tags at all, and
+    # with nothing removed there is no whitespace damage to clean up either.
+    if "<think" not in lowered and "<thought" not in lowered and "<reason" not in lowered:
+        return response
+
+    # Single pass: every tag starts with "<", so hop between "<" positions and
+    # test the known openers at each one. The response is traversed once no
+    # matter how many different tag kinds it mixes, instead of once per kind.
+    parts = []
+    pos = 0
+    scan = lowered.find("<")
+    while scan != -1:
+        for opener, closer in _THINKING_TAG_PAIRS:
+            if lowered.startswith(opener, scan):
+                end = lowered.find(closer, scan + len(opener))
+                if end != -1:
+                    parts.append(response[pos:scan])
+                    pos = end + len(closer)
+                    scan = pos - 1
+                # else: unterminated tag — keep it and the remainder untouched.
+                break
+        scan = lowered.find("<", scan + 1)
+    parts.append(response[pos:])
+    response = "".join(parts)
+
+    # Clean up extra whitespace left by removal
+    cleaned = _EXTRA_BLANK_LINES_RE.sub("\n\n", response)  # Multiple blank lines
+    return cleaned.strip()
@@ -1,5 +1,6 @@
 """Configuration management for PR review functionality."""
 
+import functools
 import os
 from dataclasses import dataclass
 from enum import Enum
@@ -8,6 +9,11 @@ from typing import Dict, List, Optional
 
 import yaml
 
+try:  # Prefer the libyaml C implementation when available (much faster)
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 class LLMProvider(Enum):
     """Supported LLM providers."""
@@ -111,6 +117,141 @@ def _is_placeholder_token(token: Optional[str]) -> bool:
     return any(pattern in token_lower for pattern in placeholder_patterns)
 
 
+# Environment fallback ladders, most-preferred first.
+_GITHUB_TOKEN_ENV_VARS = ("KIT_GITHUB_TOKEN", "GITHUB_TOKEN")
+_API_KEY_ENV_VARS: Dict[str, tuple] = {
+    "anthropic": ("KIT_ANTHROPIC_TOKEN", "ANTHROPIC_API_KEY"),
+    "google": ("KIT_GOOGLE_API_KEY", "GOOGLE_API_KEY"),
+    "openai": ("KIT_OPENAI_TOKEN", "OPENAI_API_KEY"),
+}
+
+
+def _resolve_env(keys: tuple) -> Optional[str]:
+    """Return the first non-empty value among the given environment variables."""
+    for key in keys:
+        value = os.environ.get(key)
+        if value:
+            return value
+    return None
+
+
+# The default config is a fixed shape, so it is shipped as a prebuilt string
+# and written in one call instead of being round-tripped through yaml.dump.
+# This also lets the skeleton carry explanatory comments, which a dumped dict
+# cannot.
+_DEFAULT_CONFIG_FILE_CONTENT = """\
+github:
+  token: ghp_your_token_here
+  base_url: https://api.github.com
+llm:
+  provider: anthropic  # or "openai", "google"
+  model: claude-sonnet-4-20250514  # or "gpt-4o", "gemini-2.5-flash"
+  api_key: sk-your_api_key_here
+  max_tokens: 4000
+  temperature: 0.1
+  # For custom OpenAI compatible providers (e.g., Together AI, OpenRouter, etc.)
+  # api_base_url: "https://api.together.xyz/v1"  # Example: Together AI
+  # api_base_url: "https://openrouter.ai/api/v1"  # Example: OpenRouter
+  # api_base_url: "http://localhost:8000/v1"      # Example: Local OpenAI API server
+review:
+  max_files: 50
+  include_recent_prs: true
+  analysis_depth: standard  # quick, standard, thorough
+  post_as_comment: true
+  clone_for_analysis: true
+  cache_repos: true
+  cache_directory: ~/.kit/repo-cache
+  cache_ttl_hours: 24
+  # Priority filtering (can also be set via --priority CLI flag)
+  # priority_filter: ["high", "medium"]  # Only show high and medium priority issues
+  # priority_filter: ["high"]            # Only show high priority issues
+  # Performance and safety limits
+  max_review_size_mb: 5.0  # Maximum review text size in MB (prevents DoS)
+  # Agentic reviewer settings (for multi-turn analysis)
+  agentic_max_turns: 20  # Maximum number of analysis turns
+  agentic_finalize_threshold: 15  # Start encouraging finalization at this turn
+  # custom_pricing:
+  #   anthropic:
+  #     claude-3-7-sonnet-latest:
+  #       input_per_million: 3.00
+  #       output_per_million: 15.00
+  #   openai:
+  #     gpt-4o:
+  #       input_per_million: 2.50
+  #       output_per_million: 10.00
+
+# Example Ollama configuration (completely free local AI):
+# llm:
+#   provider: ollama
+#   model: "qwen2.5-coder:latest"  # Or deepseek-r1:latest, gemma3:latest, etc.
+#   api_base_url: "http://localhost:11434"  # Default Ollama endpoint
+#   api_key: "ollama"  # Placeholder (Ollama doesn't use API keys)
+#   max_tokens: 2000
+#   temperature: 0.1
+
+# Example Google Gemini configuration:
+# llm:
+#   provider: google
+#   model: "gemini-2.5-flash"  # Or "gemini-2.5-pro" for more complex reasoning, "gemini-2.0-flash-lite" for speed
+#   api_key: "AIzaSy..."  # Get from https://aistudio.google.com/apikey
+#   max_tokens: 4000
+#   temperature: 0.1
+
+# Example OpenAI compatible provider configurations:
+#
+# Together AI (https://together.ai/):
+# llm:
+#   provider: openai
+#   model: "meta-llama/Llama-3.3-70B-Instruct-Turbo"
+#   api_key: "your_together_api_key"
+#   api_base_url: "https://api.together.xyz/v1"
+#   max_tokens: 4000
+#   temperature: 0.1
+#
+# OpenRouter (https://openrouter.ai/):
+# llm:
+#   provider: openai
+#   model: "anthropic/claude-3.5-sonnet"
+#   api_key: "your_openrouter_api_key"
+#   api_base_url: "https://openrouter.ai/api/v1"
+#   max_tokens: 4000
+#   temperature: 0.1
+#
+# Local OpenAI API server (e.g., text-generation-webui, vLLM):
+# llm:
+#   provider: openai
+#   model: "local-model-name"
+#   api_key: "not-used"  # Local servers often don't require API keys
+#   api_base_url: "http://localhost:8000/v1"
+#   max_tokens: 4000
+#   temperature: 0.1
+#
+# Groq (https://groq.com/):
+# llm:
+#   provider: openai
+#   model: "llama-3.3-70b-versatile"
+#   api_key: "your_groq_api_key"
+#   api_base_url: "https://api.groq.com/openai/v1"
+#   max_tokens: 4000
+#   temperature: 0.1
+"""
+
+
+@functools.lru_cache(maxsize=16)
+def _load_raw_config(config_path: str, mtime_ns: int) -> Dict:
+    """Read and parse a YAML config file, memoized on path + mtime.
+
+    ``mtime_ns`` is part of the cache key so edits to the file invalidate
+    stale entries; a missing file is cached under ``mtime_ns=0``. Environment
+    variable resolution happens in the caller so it is never cached.
+    """
+    config_file = Path(config_path)
+    if not config_file.exists():
+        return {}
+    with open(config_file, "r") as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
 @dataclass
 class GitHubConfig:
     """GitHub configuration."""
@@ -169,20 +310,35 @@ class ReviewConfig:
         if config_path is None:
             config_path = os.path.expanduser("~/.kit/review-config.yaml")
 
-        config_data: Dict = {}
+        # Try to load from file (cached; keyed on mtime so edits are picked up)
+        try:
+            mtime_ns = os.stat(config_path).st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+        config_data: Dict = _load_raw_config(config_path, mtime_ns)
+
+        return cls._from_config_data(config_data, profile)
+
+    @classmethod
+    def from_stream(cls, source, profile: Optional[str] = None) -> "ReviewConfig":
+        """Load configuration from a YAML string or file-like object.
 
-        # Try to load from file
-        config_file = Path(config_path)
-        if config_file.exists():
-            with open(config_file, "r") as f:
-                config_data = yaml.safe_load(f) or {}
+        Skips the filesystem entirely, for callers that already hold the
+        YAML content (e.g. received over the wire). Environment variable
+        fallbacks apply exactly as in :meth:`from_file`.
+        """
+        config_data = yaml.load(source, Loader=_YamlLoader) or {}
+        return cls._from_config_data(config_data, profile)
 
+    @classmethod
+    def _from_config_data(cls, config_data: Dict, profile: Optional[str] = None) -> "ReviewConfig":
+        """Build a ReviewConfig from parsed config data plus env fallbacks."""
         # Override with environment variables
         config_github_token = config_data.get("github", {}).get("token")
         if _is_placeholder_token(config_github_token):
             config_github_token = None  # Treat placeholder as missing
 
-        github_token = config_github_token or os.getenv("KIT_GITHUB_TOKEN") or os.getenv("GITHUB_TOKEN")
+        github_token = config_github_token or _resolve_env(_GITHUB_TOKEN_ENV_VARS)
 
         if not github_token:
             raise ValueError(
@@ -207,30 +363,24 @@ class ReviewConfig:
         # Default models and API key environment variables
         if provider == LLMProvider.ANTHROPIC:
             default_model = "claude-sonnet-4-20250514"
-            api_key_env = "KIT_ANTHROPIC_TOKEN or ANTHROPIC_API_KEY"
-            config_api_key = llm_data.get("api_key")
-            if _is_placeholder_token(config_api_key):
-                config_api_key = None  # Treat placeholder as missing
-            api_key = config_api_key or os.getenv("KIT_ANTHROPIC_TOKEN") or os.getenv("ANTHROPIC_API_KEY")
         elif provider == LLMProvider.GOOGLE:
             default_model = "gemini-2.5-flash"  # Updated to latest model
-            api_key_env = "KIT_GOOGLE_API_KEY or GOOGLE_API_KEY"
-            config_api_key = llm_data.get("api_key")
-            if _is_placeholder_token(config_api_key):
-                config_api_key = None  # Treat placeholder as missing
-            api_key = config_api_key or os.getenv("KIT_GOOGLE_API_KEY") or os.getenv("GOOGLE_API_KEY")
         elif provider == LLMProvider.OLLAMA:
             default_model = "qwen2.5-coder:latest"  # Latest code-specialized model
+        else:  # OpenAI
+            default_model = "gpt-4.1-2025-04-14"
+
+        if provider == LLMProvider.OLLAMA:
             api_key_env = "None (Ollama doesn't require API keys)"
             # Ollama doesn't need an API key, but we'll use a placeholder for consistency
             api_key = llm_data.get("api_key", "ollama")
-        else:  # OpenAI
-            default_model = "gpt-4.1-2025-04-14"
-            api_key_env = "KIT_OPENAI_TOKEN or OPENAI_API_KEY"
+        else:
+            env_vars = _API_KEY_ENV_VARS[provider.value]
+            api_key_env = " or ".join(env_vars)
             config_api_key = llm_data.get("api_key")
             if _is_placeholder_token(config_api_key):
                 config_api_key = None  # Treat placeholder as missing
-            api_key = config_api_key or os.getenv("KIT_OPENAI_TOKEN") or os.getenv("OPENAI_API_KEY")
+            api_key = config_api_key or _resolve_env(env_vars)
 
         # Ollama doesn't require API keys, so skip validation for it
         if not api_key and provider != LLMProvider.OLLAMA:
@@ -310,115 +460,6 @@ class ReviewConfig:
         config_dir = Path(config_path).parent
         config_dir.mkdir(parents=True, exist_ok=True)
 
-        default_config = {
-            "github": {"token": "ghp_your_token_here", "base_url": "https://api.github.com"},
-            "llm": {
-                "provider": "anthropic",  # or "openai", "google"
-                "model": "claude-sonnet-4-20250514",  # or "gpt-4o", "gemini-2.5-flash"
-                "api_key": "sk-your_api_key_here",
-                "max_tokens": 4000,
-                "temperature": 0.1,
-                # For custom OpenAI compatible providers (e.g., Together AI, OpenRouter, etc.)
-                # "api_base_url": "https://api.together.xyz/v1",  # Example: Together AI
-                # "api_base_url": "https://openrouter.ai/api/v1",  # Example: OpenRouter
-                # "api_base_url": "http://localhost:8000/v1",      # Example: Local OpenAI API server
-            },
-            "review": {
-                "max_files": 50,
-                "include_recent_prs": True,
-                "analysis_depth": "standard",  # quick, standard, thorough
-                "post_as_comment": True,
-                "clone_for_analysis": True,
-                "cache_repos": True,
-                "cache_directory": "~/.kit/repo-cache",
-                "cache_ttl_hours": 24,
-                # Priority filtering (can also be set via --priority CLI flag)
-                # "priority_filter": ["high", "medium"],  # Only show high and medium priority issues
-                # "priority_filter": ["high"],            # Only show high priority issues
-                # Performance and safety limits
-                "max_review_size_mb": 5.0,  # Maximum review text size in MB (prevents DoS)
-                # Agentic reviewer settings (for multi-turn analysis)
-                "agentic_max_turns": 20,  # Maximum number of analysis turns
-                "agentic_finalize_threshold": 15,  # Start encouraging finalization at this turn
-                # "custom_pricing": {
-                #     "anthropic": {
-                #         "claude-3-7-sonnet-latest": {
-                #             "input_per_million": 3.00,
-                #             "output_per_million": 15.00
-                #         }
-                #     },
-                #     "openai": {
-                #         "gpt-4o": {
-                #             "input_per_million": 2.50,
-                #             "output_per_million": 10.00
-                #         }
-                #     }
-                # }
-            },
-        }
-
-        with open(config_path, "w") as f:
-            yaml.dump(default_config, f, default_flow_style=False, indent=2)
-
-        # Add a commented-out example for local Ollama usage
-        local_ollama_example = """\
-# Example Ollama configuration (completely free local AI):
-# llm:
-#   provider: ollama
-#   model: "qwen2.5-coder:latest"  # Or deepseek-r1:latest, gemma3:latest, etc.
-#   api_base_url: "http://localhost:11434"  # Default Ollama endpoint
-#   api_key: "ollama"  # Placeholder (Ollama doesn't use API keys)
-#   max_tokens: 2000
-#   temperature: 0.1
-
-# Example Google Gemini configuration:
-# llm:
-#   provider: google
-#   model: "gemini-2.5-flash"  # Or "gemini-2.5-pro" for more complex reasoning, "gemini-2.0-flash-lite" for speed
-#   api_key: "AIzaSy..."  # Get from https://aistudio.google.com/apikey
-#   max_tokens: 4000
-#   temperature: 0.1
-
-# Example OpenAI compatible provider configurations:
-#
-# Together AI (https://together.ai/):
-# llm:
-#   provider: openai
-#   model: "meta-llama/Llama-3.3-70B-Instruct-Turbo"
-#   api_key: "your_together_api_key"
-#   api_base_url: "https://api.together.xyz/v1"
-#   max_tokens: 4000
-#   temperature: 0.1
-#
-# OpenRouter (https://openrouter.ai/):
-# llm:
-#   provider: openai
-#   model: "anthropic/claude-3.5-sonnet"
-#   api_key: "your_openrouter_api_key"
-#   api_base_url: "https://openrouter.ai/api/v1"
-#   max_tokens: 4000
-#   temperature: 0.1
-#
-# Local OpenAI API server (e.g., text-generation-webui, vLLM):
-# llm:
-#   provider: openai
-#   model: "local-model-name"
-#   api_key: "not-used"  # Local servers often don't require API keys
-#   api_base_url: "http://localhost:8000/v1"
-#   max_tokens: 4000
-#   temperature: 0.1
-#
-# Groq (https://groq.com/):
-# llm:
-#   provider: openai
-#   model: "llama-3.3-70b-versatile"
-#   api_key: "your_groq_api_key"
-#   api_base_url: "https://api.groq.com/openai/v1"
-#   max_tokens: 4000
-#   temperature: 0.1
-"""
-
-        with open(config_path, "a") as f:
-            f.write("\n" + local_ollama_example)
+        Path(config_path).write_text(_DEFAULT_CONFIG_FILE_CONTENT)
 
         return config_path
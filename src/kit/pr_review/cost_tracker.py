@@ -1,35 +1,52 @@
 """Cost tracking for PR review operations."""
 
+import sys
 from dataclasses import dataclass
-from typing import ClassVar, Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import ClassVar, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from .config import LLMProvider
 
+# Shared zero-cost rate tuple so Ollama lookups never allocate.
+_OLLAMA_FREE_RATES: Tuple[float, float] = (0.0, 0.0)
 
-@dataclass
+
+@dataclass(slots=True)
 class CostBreakdown:
-    """Breakdown of costs for a PR review."""
+    """Breakdown of costs for a PR review.
+
+    Slotted: one instance is mutated per tracked LLM call, so skipping the
+    per-instance ``__dict__`` keeps the accumulation loop cheap.
+    """
 
     llm_input_tokens: int = 0
     llm_output_tokens: int = 0
     llm_cost_usd: float = 0.0
+    total_cost_usd: float = 0.0
     model_used: str = ""
     pricing_date: str = "2025-05-22"
 
+    # Parsed once by str.format instead of per-interpolation in an f-string.
+    _STR_TEMPLATE: ClassVar[str] = (
+        "\n💰 Cost Breakdown:\n   LLM Usage: ${cost:.4f} ({inp:,} input + {out:,} output tokens)\n   Model: {model}\n"
+    )
+
     def __str__(self) -> str:
         """Human-readable cost summary."""
-        return f"""
-💰 Cost Breakdown:
-   LLM Usage: ${self.llm_cost_usd:.4f} ({self.llm_input_tokens:,} input + {self.llm_output_tokens:,} output tokens)
-   Model: {self.model_used}
-"""
+        return self._STR_TEMPLATE.format(
+            cost=self.llm_cost_usd,
+            inp=self.llm_input_tokens,
+            out=self.llm_output_tokens,
+            model=self.model_used,
+        )
 
 
 class CostTracker:
     """Tracks costs for PR review operations."""
 
     # Default pricing (as of May 2025) - can be overridden in config
-    DEFAULT_PRICING: ClassVar[Dict] = {
+    _RAW_DEFAULT_PRICING: ClassVar[Dict] = {
         LLMProvider.ANTHROPIC: {
             "claude-opus-4-20250514": {
                 "input_per_million": 15.00,  # $15.00 per million input tokens
@@ -154,43 +171,85 @@ class CostTracker:
         },
     }
 
+    # Read-only view with interned model-name keys: interned strings hash by
+    # identity after first use and the proxy guards against accidental mutation
+    # of the shared class-level table.
+    DEFAULT_PRICING: ClassVar[Mapping] = MappingProxyType(
+        {
+            provider: MappingProxyType({sys.intern(model): rates for model, rates in models.items()})
+            for provider, models in _RAW_DEFAULT_PRICING.items()
+        }
+    )
+
     def __init__(self, custom_pricing: Optional[Dict] = None):
         """Initialize cost tracker with optional custom pricing."""
         self.pricing = custom_pricing or self.DEFAULT_PRICING
+        # Memoized (provider, model) -> per-million rates; pricing resolution runs
+        # once per unique model string instead of on every usage event.
+        self._pricing_cache: Dict[Tuple[LLMProvider, str], Optional[Tuple[float, float]]] = {}
+        # Leading tokens of every priced model ("gpt", "claude", ...): a name
+        # whose head isn't here can't match anything, so misses skip the
+        # per-provider walk.
+        self._known_model_heads = frozenset(
+            name.split("-", 1)[0] for models in self.pricing.values() for name in models
+        )
         self.reset()
 
+    def _resolve_pricing(self, provider: LLMProvider, model: str) -> Optional[Tuple[float, float]]:
+        """Resolve (input, output) per-token rates for a provider/model pair.
+
+        The configured per-million prices are scaled to per-token here, once,
+        so the hot tracking path is two multiplies and an add with no
+        division. Results (including misses) are cached per unique pair.
+        Returns None for unknown models; callers decide the fallback estimate.
+        """
+        key = (provider, model)
+        if key in self._pricing_cache:
+            return self._pricing_cache[key]
+
+        stripped_model = self._strip_model_prefix(model)
+        rates: Optional[Tuple[float, float]] = None
+        if stripped_model.split("-", 1)[0] in self._known_model_heads:
+            provider_pricing = self.pricing.get(provider)
+            if provider_pricing and stripped_model in provider_pricing:
+                entry = provider_pricing[stripped_model]
+                rates = (entry["input_per_million"] * 1e-6, entry["output_per_million"] * 1e-6)
+        if rates is None and provider == LLMProvider.OLLAMA:
+            rates = _OLLAMA_FREE_RATES  # All Ollama models are free (local)
+
+        self._pricing_cache[key] = rates
+        return rates
+
     def reset(self):
         """Reset cost tracking for a new review."""
         self.breakdown = CostBreakdown()
 
     def track_llm_usage(self, provider: LLMProvider, model: str, input_tokens: int, output_tokens: int):
         """Track LLM API usage and calculate costs."""
-        self.breakdown.llm_input_tokens += input_tokens
-        self.breakdown.llm_output_tokens += output_tokens
+        self.track_llm_usage_batch(provider, model, (input_tokens,), (output_tokens,))
 
-        # Strip prefix from model name for pricing lookup
-        stripped_model = self._strip_model_prefix(model)
+    def track_llm_usage_batch(
+        self, provider: LLMProvider, model: str, input_tokens: Sequence[int], output_tokens: Sequence[int]
+    ):
+        """Track many LLM calls for one provider/model in a single accounting pass.
 
-        # Get pricing for this provider/model
-        if provider in self.pricing and stripped_model in self.pricing[provider]:
-            pricing = self.pricing[provider][stripped_model]
-            input_cost = (input_tokens / 1_000_000) * pricing["input_per_million"]
-            output_cost = (output_tokens / 1_000_000) * pricing["output_per_million"]
-
-            self.breakdown.llm_cost_usd += input_cost + output_cost
-        elif provider == LLMProvider.OLLAMA:
-            # All Ollama models are free - use default $0.00 pricing
-            if provider in self.pricing and "_default" in self.pricing[provider]:
-                pricing = self.pricing[provider]["_default"]
-                self.breakdown.llm_cost_usd += 0.00  # Always free
-            else:
-                self.breakdown.llm_cost_usd += 0.00  # Fallback - still free
+        Resolves pricing once and mutates the breakdown once, so a review that
+        fires dozens of sub-agent calls pays one lookup instead of one per call.
+        """
+        total_input = sum(input_tokens)
+        total_output = sum(output_tokens)
+        self.breakdown.llm_input_tokens += total_input
+        self.breakdown.llm_output_tokens += total_output
+
+        rates = self._resolve_pricing(provider, model)
+        if rates is not None:
+            self.breakdown.llm_cost_usd += total_input * rates[0] + total_output * rates[1]
         else:
-            # Unknown model - use a reasonable estimate and warn
+            # Unknown model - use a reasonable estimate ($3/$15 per million) and warn
+            stripped_model = self._strip_model_prefix(model)
             print(f"⚠️  Unknown pricing for {provider.value}/{stripped_model}, using estimates")
             print("   Update pricing in ~/.kit/review-config.yaml or check current rates")
-            self.breakdown.llm_cost_usd += (input_tokens / 1_000_000) * 3.0
-            self.breakdown.llm_cost_usd += (output_tokens / 1_000_000) * 15.0
+            self.breakdown.llm_cost_usd += total_input * 3.0e-6 + total_output * 15.0e-6
 
         # Store the original model name with prefix for reference
         self.breakdown.model_used = model
@@ -234,13 +293,28 @@ class CostTracker:
             available[provider.value] = list(models.keys())
         return available
 
+    # Lazily built views over DEFAULT_PRICING (which is frozen, so these never
+    # go stale): sorted names, a set for membership tests, and (lower, original)
+    # pairs for suggestion matching.
+    _ALL_MODEL_NAMES: ClassVar[Optional[Tuple[str, ...]]] = None
+    _MODEL_NAME_SET: ClassVar[frozenset] = frozenset()
+    _LOWER_MODEL_NAMES: ClassVar[Tuple[Tuple[str, str], ...]] = ()
+
+    @classmethod
+    def _model_names(cls) -> Tuple[str, ...]:
+        if cls._ALL_MODEL_NAMES is None:
+            all_models: List[str] = []
+            for provider_models in cls.DEFAULT_PRICING.values():
+                all_models.extend(provider_models.keys())
+            cls._ALL_MODEL_NAMES = tuple(sorted(all_models))
+            cls._MODEL_NAME_SET = frozenset(cls._ALL_MODEL_NAMES)
+            cls._LOWER_MODEL_NAMES = tuple((name.lower(), name) for name in cls._ALL_MODEL_NAMES)
+        return cls._ALL_MODEL_NAMES
+
     @classmethod
     def get_all_model_names(cls) -> list[str]:
         """Get a flat list of all available model names."""
-        all_models = []
-        for provider_models in cls.DEFAULT_PRICING.values():
-            all_models.extend(provider_models.keys())
-        return sorted(all_models)
+        return list(cls._model_names())
 
     @classmethod
     def _strip_model_prefix(cls, model_name: str) -> str:
@@ -251,25 +325,28 @@ class CostTracker:
         - openrouter/meta-llama/llama-3.3-70b -> meta-llama/llama-3.3-70b
         - gpt-4o -> gpt-4o (unchanged)
         """
-        # Remove anything before the first "/"
-        if "/" in model_name:
-            return model_name.split("/", 1)[1]
-
-        return model_name
+        # Bare model names ("gpt-4o", "claude-...") are the overwhelmingly
+        # common case: one C-level containment scan and out, no tuple built.
+        if "/" not in model_name:
+            return model_name
+        # Drop everything before the first "/".
+        return model_name.partition("/")[2]
 
     @classmethod
+    @lru_cache(maxsize=256)
     def is_valid_model(cls, model_name: str) -> bool:
         """Check if a model name is valid/supported.
 
         Supports prefixed model names like 'vertex_ai/claude-sonnet-4-20250514'.
         """
+        cls._model_names()
+
         # Try exact match first
-        if model_name in cls.get_all_model_names():
+        if model_name in cls._MODEL_NAME_SET:
             return True
 
         # Try with prefix stripped
-        stripped_model = cls._strip_model_prefix(model_name)
-        if stripped_model in cls.get_all_model_names():
+        if cls._strip_model_prefix(model_name) in cls._MODEL_NAME_SET:
             return True
 
         # Special case for Ollama - any model is valid since it's local
@@ -282,28 +359,33 @@ class CostTracker:
     @classmethod
     def get_model_suggestions(cls, invalid_model: str) -> list[str]:
         """Get model suggestions for an invalid model name."""
-        all_models = cls.get_all_model_names()
+        return list(cls._cached_suggestions(invalid_model))
+
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _cached_suggestions(cls, invalid_model: str) -> Tuple[str, ...]:
+        """Memoized suggestion lookup; typo'd names repeat within a session."""
+        cls._model_names()
         suggestions = []
 
         # Strip prefix for comparison
         stripped_invalid = cls._strip_model_prefix(invalid_model).lower()
+        significant_parts = [part for part in stripped_invalid.split("-")[:2] if len(part) > 2]
 
         # Check for models that start similarly or contain common parts
-        for model in all_models:
-            lower_model = model.lower()
+        for lower_model, model in cls._LOWER_MODEL_NAMES:
             # Check if models start similarly
             starts_similar = lower_model.startswith(stripped_invalid[:4]) or stripped_invalid.startswith(
                 lower_model[:4]
             )
             # Check if any significant parts match
-            parts_match = any(part in lower_model for part in stripped_invalid.split("-")[:2] if len(part) > 2)
+            parts_match = any(part in lower_model for part in significant_parts)
 
             if starts_similar or parts_match:
                 suggestions.append(model)
 
         # If no good matches, return a few popular ones
         if not suggestions:
-            popular_models = ["gpt-4.1-nano", "gpt-4o-mini", "claude-3-5-sonnet-20241022"]
-            suggestions = popular_models
+            suggestions = ["gpt-4.1-nano", "gpt-4o-mini", "claude-3-5-sonnet-20241022"]
 
-        return suggestions[:5]  # Limit to 5 suggestions
+        return tuple(suggestions[:5])  # Limit to 5 suggestions
@@ -4,11 +4,15 @@ import asyncio
 import re
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
 from kit import Repository
+from kit._thinking import strip_thinking_tokens as _strip_thinking_tokens
 
 from .cache import RepoCache
 from .config import LLMProvider, ReviewConfig
@@ -18,25 +22,52 @@ from .file_prioritizer import FilePrioritizer
 from .priority_filter import filter_review_by_priority
 from .validator import validate_review_quality
 
+# https://github.com/owner/repo/pull/123 (compiled once; parse_pr_url is hot
+# when reviewing PR batches)
+_PR_URL_RE = re.compile(r"https://(?:\w+\.)?github\.com/([^/]+)/([^/]+)/pull/(\d+)")
+
+
+@lru_cache(maxsize=8)
+def _session_for(token: str, session_cls: type) -> requests.Session:
+    """Build (or reuse) a pooled GitHub session for a token.
+
+    Reviewers created with the same token share one session, so sequential
+    reviews reuse the TCP/TLS connection pool instead of re-handshaking with
+    api.github.com. ``session_cls`` is part of the cache key so callers that
+    substitute the Session class get their own entry.
+    """
+    session = session_cls()
+    session.headers.update(
+        {
+            "Authorization": f"token {token}",
+            "Accept": "application/vnd.github.v3+json",
+            "User-Agent": "kit-review/0.6.1",
+        }
+    )
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    return session
+
 
 class PRReviewer:
     """PR reviewer that uses kit's Repository class and LLM analysis for intelligent code reviews."""
 
-    def __init__(self, config: ReviewConfig):
+    def __init__(self, config: ReviewConfig, cost_tracker: Optional[CostTracker] = None):
         self.config = config
-        self.github_session = requests.Session()
-        self.github_session.headers.update(
-            {
-                "Authorization": f"token {config.github.token}",
-                "Accept": "application/vnd.github.v3+json",
-                "User-Agent": "kit-review/0.6.1",
-            }
-        )
+        self.github_session = _session_for(config.github.token, requests.Session)
         self._llm_client: Optional[Any] = None  # Will be Anthropic or OpenAI client
         # Pass quiet mode to repo cache
         quiet = self.config.quiet
         self.repo_cache = RepoCache(config, quiet=quiet)
-        self.cost_tracker = CostTracker(config.custom_pricing)
+        # Each reviewer gets its own tracker by default so per-review cost
+        # reporting stays accurate (matrix_tester reads one reviewer's totals
+        # per cell). Batch callers that want aggregated costs can pass a
+        # shared CostTracker explicitly.
+        self.cost_tracker = cost_tracker if cost_tracker is not None else CostTracker(config.custom_pricing)
 
         # Diff caching (initialized to None, filled lazily)
         self._cached_diff_key: Optional[tuple[str, str, int]] = None
@@ -44,6 +75,10 @@ class PRReviewer:
         self._cached_parsed_diff: Optional[Dict[str, FileDiff]] = None
         self._cached_parsed_key: Optional[tuple[str, str, int]] = None
 
+    def reset_cost_tracker(self) -> None:
+        """Zero accumulated costs (useful when a tracker is shared across reviewers)."""
+        self.cost_tracker.reset()
+
     def parse_pr_url(self, pr_input: str) -> tuple[str, str, int]:
         """Parse PR URL or number to extract owner, repo, and PR number.
 
@@ -61,9 +96,7 @@ class PRReviewer:
             )
 
         # Parse GitHub URL
-        # https://github.com/owner/repo/pull/123
-        url_pattern = r"https://(?:\w+\.)?github\.com/([^/]+)/([^/]+)/pull/(\d+)"
-        match = re.match(url_pattern, pr_input)
+        match = _PR_URL_RE.match(pr_input)
 
         if not match:
             raise ValueError(f"Invalid GitHub PR URL: {pr_input}")
@@ -481,16 +514,19 @@ class PRReviewer:
                     f"[STANDARD MODE - {self.config.llm.model} | max_tokens={self.config.llm.max_tokens}]"
                 )
 
-            # Get PR details
-            pr_details = self.get_pr_details(owner, repo, pr_number)
+            # Fetch PR details and changed files concurrently; the two GitHub
+            # requests are independent, so wall time is the slower of the two
+            # instead of their sum.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                details_future = executor.submit(self.get_pr_details, owner, repo, pr_number)
+                files_future = executor.submit(self.get_pr_files, owner, repo, pr_number)
+                pr_details = details_future.result()
+                files = files_future.result()
+
             if not quiet:
                 print(f"PR Title: {pr_details['title']}")
                 print(f"PR Author: {pr_details['user']['login']}")
                 print(f"Base: {pr_details['base']['ref']} -> Head: {pr_details['head']['ref']}")
-
-            # Get changed files
-            files = self.get_pr_files(owner, repo, pr_number)
-            if not quiet:
                 print(f"Changed files: {len(files)}")
 
             # For more comprehensive analysis, clone the repo
@@ -604,35 +640,3 @@ class PRReviewer:
         self._cached_parsed_key = key
         self._cached_parsed_diff = parsed
         return parsed
-
-
-def _strip_thinking_tokens(response: str) -> str:
-    """
-    Strip thinking tokens from LLM responses.
-
-    Reasoning models like DeepSeek R1 include <think>...</think> tags
-    that show internal reasoning but aren't meant for end users.
-    """
-    if not response:
-        return response
-
-    import re
-
-    # Common thinking token patterns used by reasoning models
-    patterns = [
-        r"<think>.*?</think>",  # DeepSeek R1, others
-        r"<thinking>.*?</thinking>",  # Alternative format
-        r"<thought>.*?</thought>",  # Another variant
-        r"<reason>.*?</reason>",  # Reasoning blocks
-    ]
-
-    cleaned = response
-    for pattern in patterns:
-        # Use DOTALL flag to match across newlines
-        cleaned = re.sub(pattern, "", cleaned, flags=re.DOTALL | re.IGNORECASE)
-
-    # Clean up extra whitespace left by removal
-    cleaned = re.sub(r"\n\s*\n\s*\n", "\n\n", cleaned)  # Multiple blank lines
-    cleaned = cleaned.strip()
-
-    return cleaned
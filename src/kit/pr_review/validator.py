@@ -4,6 +4,24 @@ import re
 from dataclasses import dataclass
 from typing import Dict, List, Set, Union
 
+# Single alternation compiled once at import: one left-to-right scan of the
+# review text feeds the line/specific/vague/github metrics instead of a dozen
+# independent re.findall passes. Markdown GitHub links are re-scanned for the
+# references they embed (e.g. "[file.py:12](...#L12)") so nested counts match
+# the old per-pattern passes.
+_TEXT_METRICS = (
+    r"(?P<line>\w+\.\w+:\d+|line\s+\d+|L\d+)"
+    r"|(?P<specific>should\s+use\s+\w+|missing\s+\w+|consider\s+\w+|add\s+\w+"
+    r"|remove\s+\w+|fix\s+\w+|\w+\s+is\s+(?:unused|incorrect|missing))"
+    r"|(?P<vague>looks?\s+good|seems?\s+fine|overall\s+\w+|generally\s+\w+"
+    r"|might\s+want\s+to\s+consider|it\s+would\s+be\s+nice)"
+)
+_REVIEW_SCAN = re.compile(
+    r"(?P<github>\[[^\]]+\]\(https://github\.com/[^)]+\))|" + _TEXT_METRICS,
+    re.IGNORECASE,
+)
+_LINK_BODY_SCAN = re.compile(_TEXT_METRICS, re.IGNORECASE)
+
 
 @dataclass
 class ValidationResult:
@@ -25,39 +43,45 @@ class ReviewValidator:
         issues = []
         metrics: Dict[str, Union[int, float]] = {}
 
+        # Normalize once; the sub-checks below share these instead of
+        # re-lowercasing/encoding the (potentially multi-KB) review each.
+        review_lower = review_content.lower()
+        review_bytes = review_content.encode("utf-8", "ignore")
+
         # 1. Reference validation - does review reference actual diff content?
-        metrics["file_references"] = self._count_file_references(review_content, changed_files)
+        metrics["file_references"] = self._count_file_references(review_bytes, changed_files)
         if metrics["file_references"] == 0 and len(changed_files) > 0:
             issues.append("Review doesn't reference any changed files")
 
-        # 2. Line number validation - are line references plausible?
-        metrics["line_references"] = self._count_line_references(review_content)
+        # 2-4. Line references, specificity, and GitHub links come from one
+        # combined scan of the review text (see _REVIEW_SCAN).
+        scan_counts = self._scan_review(review_content)
+
+        metrics["line_references"] = scan_counts["line"]
         invalid_lines = self._validate_line_references(review_content, pr_diff)
         if invalid_lines:
             issues.append(f"Invalid line references: {invalid_lines}")
 
-        # 3. Specificity check - concrete vs vague feedback
-        metrics["specific_issues"] = self._count_specific_issues(review_content)
-        metrics["vague_statements"] = self._count_vague_statements(review_content)
+        metrics["specific_issues"] = scan_counts["specific"]
+        metrics["vague_statements"] = scan_counts["vague"]
 
         if metrics["specific_issues"] == 0 and len(changed_files) > 0:
             issues.append("Review contains no specific, actionable feedback")
 
-        # 4. GitHub link validation
-        metrics["github_links"] = self._count_github_links(review_content)
+        metrics["github_links"] = scan_counts["github"]
         broken_links = self._validate_github_links(review_content, changed_files)
         if broken_links:
             issues.append(f"Broken GitHub links: {broken_links}")
 
         # 5. Content relevance - does review discuss code changes?
-        code_relevance = self._assess_code_relevance(review_content, pr_diff)
+        code_relevance = self._assess_code_relevance(review_lower, pr_diff)
         metrics["code_relevance"] = code_relevance
         if code_relevance < 0.3:
             issues.append("Review doesn't seem to discuss actual code changes")
 
         # 6. Completeness - covers major changes?
         major_changes = self._identify_major_changes(pr_diff)
-        coverage = self._assess_change_coverage(review_content, major_changes)
+        coverage = self._assess_change_coverage(review_lower, major_changes)
         metrics["change_coverage"] = coverage
         if coverage < 0.5 and len(major_changes) > 0:
             issues.append("Review misses major code changes")
@@ -67,29 +91,36 @@ class ReviewValidator:
 
         return ValidationResult(score=score, issues=issues, metrics=metrics)
 
-    def _count_file_references(self, review: str, changed_files: List[str]) -> int:
-        """Count how many changed files are referenced in the review."""
+    def _scan_review(self, review: str) -> Dict[str, int]:
+        """Count line references, specific issues, vague statements, and GitHub
+        links in a single pass over the review text."""
+        counts = {"github": 0, "line": 0, "specific": 0, "vague": 0}
+        for match in _REVIEW_SCAN.finditer(review):
+            group = match.lastgroup or ""
+            counts[group] += 1
+            if group == "github":
+                # Link text and anchors commonly embed line references; count
+                # them too, as the independent passes did.
+                for inner in _LINK_BODY_SCAN.finditer(match.group()):
+                    counts[inner.lastgroup or ""] += 1
+        return counts
+
+    def _count_file_references(self, review_bytes: bytes, changed_files: List[str]) -> int:
+        """Count how many changed files are referenced in the review.
+
+        Operates on the UTF-8 encoded review so each containment check is a
+        C-level bytes search rather than a Unicode scan.
+        """
         count = 0
         for file_path in changed_files:
             # Check for various file reference patterns
             filename = file_path.split("/")[-1]
-            if filename in review or file_path in review:
+            if review_bytes.find(filename.encode("utf-8", "ignore")) != -1 or (
+                review_bytes.find(file_path.encode("utf-8", "ignore")) != -1
+            ):
                 count += 1
         return count
 
-    def _count_line_references(self, review: str) -> int:
-        """Count line number references in the review."""
-        # Pattern: file.py:123 or file.py line 123
-        line_patterns = [
-            r"\w+\.\w+:\d+",  # file.py:123
-            r"line\s+\d+",  # line 123
-            r"L\d+",  # L123
-        ]
-        count = 0
-        for pattern in line_patterns:
-            count += len(re.findall(pattern, review, re.IGNORECASE))
-        return count
-
     def _validate_line_references(self, review: str, pr_diff: str) -> List[str]:
         """Check if line references are plausible given the diff."""
         # Extract line numbers from review
@@ -118,44 +149,6 @@ class ReviewValidator:
 
         return invalid
 
-    def _count_specific_issues(self, review: str) -> int:
-        """Count specific, actionable issues in the review."""
-        specific_patterns = [
-            r"should\s+use\s+\w+",  # "should use X"
-            r"missing\s+\w+",  # "missing error handling"
-            r"consider\s+\w+",  # "consider using"
-            r"add\s+\w+",  # "add validation"
-            r"remove\s+\w+",  # "remove unused"
-            r"fix\s+\w+",  # "fix the bug"
-            r"\w+\s+is\s+(unused|incorrect|missing)",  # "variable is unused"
-        ]
-
-        count = 0
-        for pattern in specific_patterns:
-            count += len(re.findall(pattern, review, re.IGNORECASE))
-        return count
-
-    def _count_vague_statements(self, review: str) -> int:
-        """Count vague, non-actionable statements."""
-        vague_patterns = [
-            r"looks?\s+good",
-            r"seems?\s+fine",
-            r"overall\s+\w+",
-            r"generally\s+\w+",
-            r"might\s+want\s+to\s+consider",
-            r"it\s+would\s+be\s+nice",
-        ]
-
-        count = 0
-        for pattern in vague_patterns:
-            count += len(re.findall(pattern, review, re.IGNORECASE))
-        return count
-
-    def _count_github_links(self, review: str) -> int:
-        """Count GitHub file links in the review."""
-        github_link_pattern = r"\[([^\]]+)\]\(https://github\.com/[^)]+\)"
-        return len(re.findall(github_link_pattern, review))
-
     def _validate_github_links(self, review: str, changed_files: List[str]) -> List[str]:
         """Check if GitHub links reference actual changed files."""
         # Extract links
@@ -176,8 +169,11 @@ class ReviewValidator:
 
         return invalid
 
-    def _assess_code_relevance(self, review: str, pr_diff: str) -> float:
-        """Assess how much the review discusses actual code changes."""
+    def _assess_code_relevance(self, review_lower: str, pr_diff: str) -> float:
+        """Assess how much the review discusses actual code changes.
+
+        ``review_lower`` is the pre-lowercased review text.
+        """
         # Extract key terms from diff
         diff_terms = set()
 
@@ -201,7 +197,7 @@ class ReviewValidator:
         if not diff_terms:
             return 0.5  # Neutral if no terms to check
 
-        mentioned_terms = sum(1 for term in diff_terms if term.lower() in review.lower())
+        mentioned_terms = sum(1 for term in diff_terms if term.lower() in review_lower)
         return min(1.0, mentioned_terms / max(5, len(diff_terms) * 0.3))
 
     def _identify_major_changes(self, pr_diff: str) -> List[str]:
@@ -225,8 +221,11 @@ class ReviewValidator:
 
         return list(set(major_changes))  # Deduplicate
 
-    def _assess_change_coverage(self, review: str, major_changes: List[str]) -> float:
-        """Assess how well the review covers major changes."""
+    def _assess_change_coverage(self, review_lower: str, major_changes: List[str]) -> float:
+        """Assess how well the review covers major changes.
+
+        ``review_lower`` is the pre-lowercased review text.
+        """
         if not major_changes:
             return 1.0
 
@@ -240,7 +239,7 @@ class ReviewValidator:
         covered = 0
         for change_type in major_changes:
             keywords = coverage_keywords.get(change_type, [])
-            if any(keyword in review.lower() for keyword in keywords):
+            if any(keyword in review_lower for keyword in keywords):
                 covered += 1
 
         return covered / len(major_changes)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import os
 from pathlib import Path, PurePath
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import pathspec
 
@@ -167,6 +167,18 @@ class RepoMapper:
             logging.debug(f"File type {ext} not supported for symbol extraction: {file_path}")
             return []
 
+    def iter_symbols(self) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Yields (file, symbols) pairs for every scanned file.
+
+        Unlike get_repo_map(), this does not build a fresh symbols dict, so
+        callers that stream results (e.g. JSON export) keep peak memory at
+        one file's worth of symbols.
+        """
+        self.scan_repo()
+        for file, entry in self._symbol_map.items():
+            yield file, entry["symbols"]
+
     def get_repo_map(self) -> Dict[str, Any]:
         """
         Returns a dict with file tree and a mapping of files to their symbols.
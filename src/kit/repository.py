@@ -3,19 +3,45 @@ from __future__ import annotations
 import os
 import subprocess
 import tempfile
+import threading
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
-from .code_searcher import CodeSearcher
-from .context_extractor import ContextExtractor
-from .llm_context import ContextAssembler
-from .repo_mapper import RepoMapper
-from .vector_searcher import VectorSearcher
+try:
+    import orjson  # C-accelerated JSON; used for index/symbol export when available
+except ImportError:  # pragma: no cover - exercised only without the optional dep
+    orjson = None  # type: ignore[assignment]
 
-# Use TYPE_CHECKING for Summarizer to avoid circular imports
+from functools import cached_property
+
+# Heavy collaborators (tree-sitter, search, context assembly) are imported lazily
+# inside the cached properties below so Repository construction stays cheap;
+# TYPE_CHECKING imports keep the annotations resolvable.
 if TYPE_CHECKING:
+    from .code_searcher import CodeSearcher
+    from .context_extractor import ContextExtractor
     from .dependency_analyzer.dependency_analyzer import DependencyAnalyzer
+    from .llm_context import ContextAssembler
+    from .repo_mapper import RepoMapper
     from .summaries import AnthropicConfig, GoogleConfig, OllamaConfig, OpenAIConfig, Summarizer
+    from .vector_searcher import VectorSearcher
+
+
+# Per-worker RepoMapper for extract_symbols_parallel: built once per process by the
+# pool initializer so each task doesn't re-read .gitignore or re-init parsers.
+_worker_mapper: Optional["RepoMapper"] = None
+
+
+def _init_symbol_worker(repo_path: str) -> None:
+    global _worker_mapper
+    from .repo_mapper import RepoMapper
+
+    _worker_mapper = RepoMapper(repo_path)
+
+
+def _extract_symbols_worker(file_path: str) -> List[Dict[str, Any]]:
+    assert _worker_mapper is not None
+    return _worker_mapper.extract_symbols(file_path)
 
 
 class Repository:
@@ -32,6 +58,20 @@ class Repository:
         ref: Optional[str] = None,
     ) -> None:
         self.ref = ref  # Store the requested ref
+        # Memoized git metadata (SHA, short SHA, branch), remote URL, and generic
+        # _git_command results; populated lazily so constructing a Repository never
+        # spawns git just for bookkeeping. Initialized before any clone/checkout so
+        # mutation paths can safely call refresh().
+        self._git_meta_cache: Optional[Tuple[str, str, Optional[str]]] = None
+        self._remote_url_cache: Optional[str] = None
+        self._remote_url_fetched: bool = False
+        self._git_cache: Dict[Tuple[str, ...], Optional[str]] = {}
+        # Inverted name -> [(file, symbol)] index and memoized text-search hits for
+        # find_symbol_usages; built lazily, dropped by refresh().
+        self._symbol_index: Optional[Dict[str, List[Tuple[str, Dict[str, Any]]]]] = None
+        self._search_text_cache: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self._resolved_root: Optional[Path] = None  # realpath of local_path, computed on first get_abs_path
+        self._tree_cache: Optional[List[Dict[str, Any]]] = None  # memoized file tree; treat as read-only
         if path_or_url.startswith("http://") or path_or_url.startswith("https://"):  # Remote repo
             self.local_path = self._clone_github_repo(path_or_url, github_token, cache_dir, ref)
         else:
@@ -41,10 +81,32 @@ class Repository:
             if ref:
                 self._checkout_ref(ref)
         self.repo_path: str = str(self.local_path)
-        self.mapper: RepoMapper = RepoMapper(self.repo_path)
-        self.searcher: CodeSearcher = CodeSearcher(self.repo_path)
-        self.context: ContextExtractor = ContextExtractor(self.repo_path)
-        self.vector_searcher: Optional[VectorSearcher] = None
+        # Stat .git once; every git-backed property re-checking it costs two
+        # syscalls per access. refresh() re-probes if the repo changes out of band.
+        self._is_git_repo: bool = (self.local_path / ".git").is_dir()
+        # Persistent `git cat-file --batch` co-process for reading blobs at a ref
+        # without spawning git per file; created lazily by get_file_content_at_ref.
+        self._cat_file_proc: Optional[subprocess.Popen] = None
+        self._cat_file_lock = threading.Lock()
+        self.vector_searcher: Optional["VectorSearcher"] = None
+
+    @cached_property
+    def mapper(self) -> "RepoMapper":
+        from .repo_mapper import RepoMapper
+
+        return RepoMapper(self.repo_path)
+
+    @cached_property
+    def searcher(self) -> "CodeSearcher":
+        from .code_searcher import CodeSearcher
+
+        return CodeSearcher(self.repo_path)
+
+    @cached_property
+    def context(self) -> "ContextExtractor":
+        from .context_extractor import ContextExtractor
+
+        return ContextExtractor(self.repo_path)
 
     def _checkout_ref(self, ref: str) -> None:
         """Checkout a specific ref (SHA, tag, or branch) in a local git repository."""
@@ -52,6 +114,18 @@ class Repository:
         if not (git_dir.exists() and git_dir.is_dir()):
             raise ValueError(f"Cannot checkout ref '{ref}': not a git repository")
 
+        # Skip the fetch + checkout entirely when HEAD already points at the
+        # requested ref; one batched rev-parse resolves both sides.
+        probe = subprocess.run(
+            ["git", "rev-parse", "HEAD", f"{ref}^{{commit}}"],
+            cwd=str(self.local_path),
+            capture_output=True,
+            check=False,
+        )
+        shas = probe.stdout.decode("utf-8", "replace").split()
+        if probe.returncode == 0 and len(shas) == 2 and shas[0] == shas[1]:
+            return
+
         try:
             # First, try to fetch the ref in case it's not available locally
             subprocess.run(
@@ -65,41 +139,74 @@ class Repository:
             _ = subprocess.run(
                 ["git", "checkout", ref], cwd=str(self.local_path), capture_output=True, text=True, check=True
             )
+            self.refresh()  # HEAD moved; invalidate memoized git state
         except subprocess.CalledProcessError as e:
             raise ValueError(f"Failed to checkout ref '{ref}': {e.stderr}")
 
+    def _git_meta(self) -> Optional[Tuple[str, str, Optional[str]]]:
+        """Fetch (sha, short_sha, branch) for HEAD in a single git call, memoized per instance.
+
+        Batches what used to be three separate ``git rev-parse`` spawns into one
+        ``git rev-parse HEAD --abbrev-ref HEAD`` invocation; branch is None when
+        HEAD is detached. Returns None if this is not a git repository or the
+        command fails (e.g. an empty repo with no commits).
+        """
+        if self._git_meta_cache is not None:
+            return self._git_meta_cache
+        output = self._git_command(["git", "rev-parse", "HEAD", "--abbrev-ref", "HEAD"])
+        if not output:
+            return None
+        lines = output.splitlines()
+        if len(lines) < 2:
+            return None
+        sha, branch = lines[0].strip(), lines[1].strip()
+        self._git_meta_cache = (sha, sha[:7], branch if branch and branch != "HEAD" else None)
+        return self._git_meta_cache
+
     @property
     def current_sha(self) -> Optional[str]:
         """Get the current commit SHA (full)."""
-        return self._git_command(["git", "rev-parse", "HEAD"])
+        meta = self._git_meta()
+        return meta[0] if meta else None
 
     @property
     def current_sha_short(self) -> Optional[str]:
         """Get the current commit SHA (short)."""
-        return self._git_command(["git", "rev-parse", "--short", "HEAD"])
+        meta = self._git_meta()
+        return meta[1] if meta else None
 
     @property
     def current_branch(self) -> Optional[str]:
         """Get the current branch name, or None if in detached HEAD state."""
-        branch = self._git_command(["git", "rev-parse", "--abbrev-ref", "HEAD"])
-        return branch if branch and branch != "HEAD" else None
+        meta = self._git_meta()
+        return meta[2] if meta else None
 
     @property
     def remote_url(self) -> Optional[str]:
         """Get the remote origin URL."""
-        return self._git_command(["git", "config", "--get", "remote.origin.url"])
+        if not self._remote_url_fetched:
+            self._remote_url_cache = self._git_command(["git", "config", "--get", "remote.origin.url"])
+            self._remote_url_fetched = True
+        return self._remote_url_cache
+
+    @staticmethod
+    def _split_null_separated(output: Optional[str]) -> List[str]:
+        """Split NUL-delimited for-each-ref output into ref names."""
+        if not output:
+            return []
+        return [name for name in (chunk.strip() for chunk in output.split("\x00")) if name]
 
     @property
     def tags(self) -> List[str]:
         """Get all tags in the repository."""
-        result = self._git_command(["git", "tag", "--list"])
-        return result.split("\n") if result else []
+        result = self._git_command(["git", "for-each-ref", "--format=%(refname:short)%00", "refs/tags"])
+        return self._split_null_separated(result)
 
     @property
     def branches(self) -> List[str]:
         """Get all local branches."""
-        result = self._git_command(["git", "branch", "--format=%(refname:short)"])
-        return result.split("\n") if result else []
+        result = self._git_command(["git", "for-each-ref", "--format=%(refname:short)%00", "refs/heads"])
+        return self._split_null_separated(result)
 
     @property
     def is_dirty(self) -> bool:
@@ -107,82 +214,107 @@ class Repository:
         result = self._git_command(["git", "status", "--porcelain"])
         return bool(result and result.strip())
 
+    # Git subcommands whose output reflects mutable working-tree state and must not
+    # be served from the per-instance cache (see is_dirty).
+    _UNCACHED_GIT_SUBCOMMANDS = frozenset({"status", "diff", "fetch", "checkout"})
+
     def _git_command(self, cmd: List[str]) -> Optional[str]:
-        """Execute a git command and return the output, or None if it fails."""
-        git_dir = self.local_path / ".git"
-        if not (git_dir.exists() and git_dir.is_dir()):
+        """Execute a git command and return the output, or None if it fails.
+
+        Results are memoized per instance (keyed on the full command tuple) so
+        repeated property access doesn't re-spawn git; volatile subcommands like
+        ``status`` are always re-run. Call :meth:`refresh` to drop the cache.
+        """
+        if not self._is_git_repo:
             return None
 
+        key = tuple(cmd)
+        cacheable = len(cmd) > 1 and cmd[1] not in self._UNCACHED_GIT_SUBCOMMANDS
+        if cacheable and key in self._git_cache:
+            return self._git_cache[key]
+
         try:
-            result = subprocess.run(cmd, cwd=self.repo_path, capture_output=True, text=True, check=True)
-            return result.stdout.strip() if result.stdout else None
+            # Bytes mode: one decode of the (tiny) output beats per-call
+            # locale lookup and text-wrapper construction under text=True.
+            result = subprocess.run(cmd, cwd=self.repo_path, capture_output=True, check=True)
+            output = result.stdout.decode("utf-8", "replace").strip() or None
         except subprocess.CalledProcessError:
-            return None
+            output = None
+        if cacheable:
+            self._git_cache[key] = output
+        return output
+
+    def refresh(self) -> None:
+        """Drop all memoized git state (HEAD metadata, remote URL, command cache).
+
+        Call this after mutating the repository out-of-band (e.g. an external
+        checkout or commit) so the ``current_*`` properties re-read HEAD.
+        """
+        self._git_meta_cache = None
+        self._remote_url_cache = None
+        self._remote_url_fetched = False
+        self._git_cache.clear()
+        self._symbol_index = None
+        self._search_text_cache.clear()
+        self._tree_cache = None
+        self._is_git_repo = (self.local_path / ".git").is_dir()
 
     def __str__(self) -> str:
+        # Walking the file tree can take seconds on a big repo; a repr (often hit
+        # from logging) should only pay that once per instance (see get_file_tree).
         file_count = len(self.get_file_tree())
         # The self.repo_path is already a string, set in __init__
         path_info = self.repo_path
 
-        # Check if it's a git repo and try to get ref.
-        # This assumes local_path is a Path object and points to a git repo.
+        # Check if it's a git repo and try to get ref. Reads from the memoized
+        # metadata so rendering many reprs doesn't spawn git repeatedly.
         ref_info = ""
-        # self.local_path is already a Path object from __init__
-        git_dir = self.local_path / ".git"
-        if git_dir.exists() and git_dir.is_dir():
-            try:
-                # Get current branch name
-                branch_cmd = ["git", "rev-parse", "--abbrev-ref", "HEAD"]
-                # Use self.repo_path (string) for cwd as subprocess expects string path
-                branch_result = subprocess.run(
-                    branch_cmd, cwd=self.repo_path, capture_output=True, text=True, check=False
-                )
-                if branch_result.returncode == 0 and branch_result.stdout.strip() != "HEAD":
-                    ref_info = f", branch: {branch_result.stdout.strip()}"
+        try:
+            meta = self._git_meta()
+            if meta is not None:
+                _sha, short_sha, branch = meta
+                if branch is not None:
+                    ref_info = f", branch: {branch}"
                 else:
-                    # If not on a branch (detached HEAD), get commit SHA
-                    sha_cmd = ["git", "rev-parse", "--short", "HEAD"]
-                    sha_result = subprocess.run(
-                        sha_cmd, cwd=self.repo_path, capture_output=True, text=True, check=False
-                    )
-                    if sha_result.returncode == 0:
-                        ref_info = f", commit: {sha_result.stdout.strip()}"
-            except Exception:
-                pass  # Silently ignore errors in getting git info for __str__
+                    # Detached HEAD: show the commit SHA instead
+                    ref_info = f", commit: {short_sha}"
+        except Exception:
+            pass  # Silently ignore errors in getting git info for __str__
 
         return f"<Repository path='{path_info}'{ref_info}, files: {file_count}>"
 
     def _clone_github_repo(
         self, url: str, token: Optional[str], cache_dir: Optional[str], ref: Optional[str] = None
     ) -> Path:
-        from urllib.parse import urlparse
-
-        repo_name = urlparse(url).path.strip("/").replace("/", "-")
+        # Path component after the host (e.g. "owner/repo"); plain string ops are
+        # cheaper than a full urlparse for the URLs git accepts here.
+        after_scheme = url.split("://", 1)[-1].split("/", 1)
+        repo_name = (after_scheme[1] if len(after_scheme) > 1 else "").strip("/").replace("/", "-")
         # Include ref in cache path if specified to avoid conflicts
         if ref:
             repo_name = f"{repo_name}-{ref.replace('/', '-')}"
 
         cache_root = Path(cache_dir or tempfile.gettempdir()) / "kit-repo-cache"
-        cache_root.mkdir(parents=True, exist_ok=True)
+        if not cache_root.exists():  # skip the mkdir syscall on the warm path
+            cache_root.mkdir(parents=True, exist_ok=True)
 
         repo_path = cache_root / repo_name
         if repo_path.exists() and (repo_path / ".git").exists():
-            # For existing cached repos, checkout the requested ref if different
+            # For existing cached repos, checkout the requested ref if different.
+            # Batched into a single shell invocation: the common "already on the
+            # ref" case costs one process spawn instead of up to four.
             if ref:
+                import shlex
+
+                quoted_ref = shlex.quote(ref)
+                script = (
+                    f"cur=$(git rev-parse --verify HEAD) && "
+                    f"tgt=$(git rev-parse --verify --quiet {quoted_ref}^{{commit}}) && "
+                    f'[ "$cur" = "$tgt" ] || '
+                    f"(git fetch --depth=1 origin {quoted_ref} && git checkout --detach FETCH_HEAD)"
+                )
                 try:
-                    current_sha = subprocess.run(
-                        ["git", "rev-parse", "HEAD"], cwd=str(repo_path), capture_output=True, text=True, check=True
-                    ).stdout.strip()
-
-                    # Check if we're already on the requested ref
-                    target_sha = subprocess.run(
-                        ["git", "rev-parse", ref], cwd=str(repo_path), capture_output=True, text=True, check=False
-                    )
-
-                    if target_sha.returncode != 0 or current_sha != target_sha.stdout.strip():
-                        # Need to fetch and checkout the ref
-                        subprocess.run(["git", "fetch", "origin"], cwd=str(repo_path), check=True)
-                        subprocess.run(["git", "checkout", ref], cwd=str(repo_path), check=True)
+                    subprocess.run(["bash", "-c", script], cwd=str(repo_path), capture_output=True, check=True)
                 except subprocess.CalledProcessError:
                     # If checkout fails, remove cache and re-clone
                     import shutil
@@ -194,25 +326,28 @@ class Repository:
                 # No specific ref requested, use existing cache
                 return repo_path
 
-        # Use GIT_ASKPASS so the token never appears in argv / process list
+        # Pass the token through an inline credential helper reading from the
+        # environment: it never appears in argv / the process list, and unlike a
+        # GIT_ASKPASS temp script there is no file to create, chmod, and unlink.
         env = os.environ.copy()
+        cred_args: List[str] = []
+        if token:
+            env["GIT_TOKEN"] = token
+            env["GIT_TERMINAL_PROMPT"] = "0"  # disable interactive prompts
+            cred_args = [
+                "-c",
+                "credential.helper=",  # drop any configured helpers first
+                "-c",
+                "credential.helper=!f() { echo username=x-access-token; echo password=$GIT_TOKEN; }; f",
+            ]
 
         # Clone with specific ref if provided
         if ref:
             # Clone without --depth for specific refs, as shallow clones might not have the ref
-            clone_cmd = ["git", "clone", "--branch", ref, url, str(repo_path)]
+            clone_cmd = ["git", *cred_args, "clone", "--branch", ref, url, str(repo_path)]
         else:
             # Default shallow clone for main/default branch
-            clone_cmd = ["git", "clone", "--depth=1", url, str(repo_path)]
-
-        if token:
-            # Create a temporary ask-pass helper that echoes the token once
-            askpass_script = tempfile.NamedTemporaryFile("w", delete=False)
-            askpass_script.write('#!/bin/sh\necho "%s"\n' % token)
-            askpass_script.flush()
-            os.chmod(askpass_script.name, 0o700)
-            env["GIT_ASKPASS"] = askpass_script.name
-            env["GIT_TERMINAL_PROMPT"] = "0"  # disable interactive prompts
+            clone_cmd = ["git", *cred_args, "clone", "--depth=1", url, str(repo_path)]
 
         try:
             subprocess.run(clone_cmd, env=env, check=True)
@@ -221,7 +356,7 @@ class Repository:
             if ref:
                 try:
                     # Clone without specific branch
-                    fallback_cmd = ["git", "clone", url, str(repo_path)]
+                    fallback_cmd = ["git", *cred_args, "clone", url, str(repo_path)]
                     subprocess.run(fallback_cmd, env=env, check=True)
                     # Then checkout the specific ref
                     subprocess.run(["git", "checkout", ref], cwd=str(repo_path), check=True)
@@ -229,22 +364,21 @@ class Repository:
                     raise ValueError(f"Failed to clone repository at ref '{ref}': {e}")
             else:
                 raise
-        finally:
-            if token:
-                try:
-                    os.unlink(askpass_script.name)
-                except OSError:
-                    pass
         return repo_path
 
     def get_file_tree(self) -> List[Dict[str, Any]]:
         """
         Returns the file tree of the repository.
 
+        The tree is memoized per instance (and shared by reference, so treat it
+        as read-only); refresh() drops the cache after the repo mutates.
+
         Returns:
             List[Dict[str, Any]]: A list of dictionaries representing the file tree.
         """
-        return self.mapper.get_file_tree()
+        if self._tree_cache is None:
+            self._tree_cache = self.mapper.get_file_tree()
+        return self._tree_cache
 
     def extract_symbols(self, file_path: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -272,6 +406,36 @@ class Repository:
                 all_symbols.extend(symbols_in_file)
             return all_symbols
 
+    def extract_symbols_parallel(self, num_processes: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Extracts symbols from all files in the repository using a process pool.
+
+        Tree-sitter parsing is CPU-bound, so splitting files across worker
+        processes scales near-linearly with core count on large repositories.
+        Results are equivalent to ``extract_symbols(None)`` but unordered
+        relative to the serial scan.
+
+        Args:
+            num_processes (Optional[int], optional): Number of worker processes.
+                                                    Defaults to ``os.cpu_count()``.
+
+        Returns:
+            List[Dict[str, Any]]: A list of dictionaries representing the extracted symbols.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        files = [entry["path"] for entry in self.get_file_tree() if not entry.get("is_dir")]
+        all_symbols: List[Dict[str, Any]] = []
+        with ProcessPoolExecutor(
+            max_workers=num_processes or os.cpu_count(),
+            initializer=_init_symbol_worker,
+            initargs=(self.repo_path,),
+        ) as executor:
+            # chunksize amortizes IPC overhead across many small files
+            for symbols in executor.map(_extract_symbols_worker, files, chunksize=32):
+                all_symbols.extend(symbols)
+        return all_symbols
+
     def search_text(self, query: str, file_pattern: str = "*") -> List[Dict[str, Any]]:
         """
         Searches for text in the repository.
@@ -347,16 +511,131 @@ class Repository:
         Raises:
             FileNotFoundError: If the file does not exist within the repository.
         """
+        # When pinned to a ref, read the blob directly from the object store via the
+        # persistent cat-file co-process; this avoids any dependence on working-tree
+        # state and any per-file git spawn.
+        if self.ref:
+            try:
+                return self.get_file_content_at_ref(self.ref, file_path)
+            except (OSError, ValueError):
+                pass  # Fall back to the working tree (e.g. non-git dir, unborn ref)
+
         full_path = self.local_path / file_path
         if not full_path.is_file():
             raise FileNotFoundError(f"File not found in repository: {file_path}")
         try:
-            with open(full_path, "r", encoding="utf-8") as f:
-                return f.read()
+            # Read raw bytes and decode in one C-level call; noticeably cheaper than
+            # TextIOWrapper's incremental decoding when reading thousands of files.
+            return full_path.read_bytes().decode("utf-8")
         except Exception as e:
             # Catch potential decoding errors or other file reading issues
             raise IOError(f"Error reading file {file_path}: {e}") from e
 
+    def read_files_bulk(self, paths: List[str], max_workers: Optional[int] = None) -> Dict[str, bytes]:
+        """
+        Reads many files concurrently and returns their raw contents.
+
+        Bulk scans (indexing, context assembly) are bound on per-file
+        open/read/close latency; overlapping the reads in a thread pool keeps
+        the kernel busy instead of waiting on each file serially. Files that
+        cannot be read are skipped.
+
+        Args:
+            paths (List[str]): File paths relative to the repository root.
+            max_workers (Optional[int], optional): Thread count; defaults to the
+                                                  executor's heuristic.
+
+        Returns:
+            Dict[str, bytes]: Mapping of relative path to file content.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        def _read(rel_path: str) -> Tuple[str, Optional[bytes]]:
+            try:
+                return rel_path, (self.local_path / rel_path).read_bytes()
+            except OSError:
+                return rel_path, None
+
+        contents: Dict[str, bytes] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for rel_path, data in executor.map(_read, paths):
+                if data is not None:
+                    contents[rel_path] = data
+        return contents
+
+    def get_file_content_at_ref(self, ref: str, file_path: str) -> str:
+        """
+        Reads a file's content as stored at a given ref, without touching the working tree.
+
+        Uses a persistent ``git cat-file --batch`` co-process so that reading many
+        files costs one git spawn total rather than one per file.
+
+        Args:
+            ref (str): The ref (SHA, tag, or branch) to read from.
+            file_path (str): The path to the file, relative to the repository root.
+
+        Returns:
+            str: The content of the file at that ref.
+
+        Raises:
+            FileNotFoundError: If the file does not exist at that ref.
+            IOError: If the content cannot be read or decoded.
+        """
+        with self._cat_file_lock:
+            proc = self._ensure_cat_file_proc()
+            assert proc.stdin is not None and proc.stdout is not None
+            try:
+                proc.stdin.write(f"{ref}:{file_path}\n".encode("utf-8"))
+                proc.stdin.flush()
+                header = proc.stdout.readline().decode("utf-8", errors="replace").strip()
+            except (BrokenPipeError, OSError):
+                # Co-process died; drop it so the next call respawns
+                self.close()
+                raise IOError(f"git cat-file process failed reading {file_path} at {ref}")
+
+            parts = header.split()
+            if len(parts) < 3 or parts[1] != "blob":
+                # "<object> missing" or a non-blob (e.g. a tree for a directory path)
+                raise FileNotFoundError(f"File not found at ref '{ref}': {file_path}")
+
+            size = int(parts[2])
+            data = proc.stdout.read(size + 1)[:size]  # +1 consumes the trailing newline
+
+        try:
+            return data.decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise IOError(f"Error decoding file {file_path} at ref '{ref}': {e}") from e
+
+    def _ensure_cat_file_proc(self) -> subprocess.Popen:
+        """Spawn the `git cat-file --batch` co-process if not already running."""
+        if self._cat_file_proc is None or self._cat_file_proc.poll() is not None:
+            self._cat_file_proc = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._cat_file_proc
+
+    def close(self) -> None:
+        """Shut down any resources held by this repository (the cat-file co-process)."""
+        proc, self._cat_file_proc = self._cat_file_proc, None
+        if proc is not None:
+            try:
+                if proc.stdin is not None:
+                    proc.stdin.close()
+                proc.terminate()
+                proc.wait(timeout=1)
+            except (OSError, subprocess.TimeoutExpired):
+                proc.kill()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass  # Interpreter may be shutting down; nothing useful to do
+
     def index(self) -> Dict[str, Any]:
         """
         Builds and returns a full index of the repo, including file tree and symbols.
@@ -375,6 +654,8 @@ class Repository:
         if self.vector_searcher is None:
             if embed_fn is None:
                 raise ValueError("embed_fn must be provided on first use (e.g. OpenAI/HF embedding function)")
+            from .vector_searcher import VectorSearcher
+
             self.vector_searcher = VectorSearcher(self, embed_fn, backend=backend, persist_dir=persist_dir)
         return self.vector_searcher
 
@@ -434,6 +715,8 @@ class Repository:
 
     def get_context_assembler(self) -> "ContextAssembler":
         """Return a ContextAssembler bound to this repository."""
+        from .llm_context import ContextAssembler
+
         return ContextAssembler(self)
 
     def get_dependency_analyzer(self, language: str = "python") -> "DependencyAnalyzer":
@@ -475,22 +758,25 @@ class Repository:
             List[Dict[str, Any]]: List of usage dicts with file, line, and context if available.
         """
         usages = []
-        repo_map = self.mapper.get_repo_map()
-        for file, symbols in repo_map["symbols"].items():
-            for sym in symbols:
-                if sym["name"] == symbol_name and (symbol_type is None or sym["type"] == symbol_type):
-                    usages.append(
-                        {
-                            "file": file,
-                            "type": sym["type"],
-                            "name": sym["name"],
-                            "line": sym.get("line"),
-                            "context": sym.get("context"),
-                        }
-                    )
+        for file, sym in self._get_symbol_index().get(symbol_name, []):
+            if symbol_type is None or sym["type"] == symbol_type:
+                usages.append(
+                    {
+                        "file": file,
+                        "type": sym["type"],
+                        "name": sym["name"],
+                        "line": sym.get("line"),
+                        "context": sym.get("context"),
+                    }
+                )
         # Optionally: search for references (calls/imports) using search_text or static analysis
-        # Here, we do a simple text search for the symbol name in all files
-        text_hits = self.searcher.search_text(symbol_name)
+        # Here, we do a simple text search for the symbol name in all files. Hits are
+        # memoized so repeated lookups (e.g. building a call graph) re-grep only once.
+        cache_key = (symbol_name, "*")
+        text_hits = self._search_text_cache.get(cache_key)
+        if text_hits is None:
+            text_hits = self.searcher.search_text(symbol_name)
+            self._search_text_cache[cache_key] = text_hits
         for hit in text_hits:
             usages.append(
                 {
@@ -502,31 +788,82 @@ class Repository:
             )
         return usages
 
+    def _get_symbol_index(self) -> Dict[str, List[Tuple[str, Dict[str, Any]]]]:
+        """Build (once) and return the inverted name -> [(file, symbol)] index.
+
+        Walking the whole repo map on every find_symbol_usages call is
+        O(total symbols); the index makes repeated lookups a dict hit. Dropped
+        by :meth:`refresh` when the repository mutates.
+        """
+        if self._symbol_index is None:
+            index: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+            repo_map = self.mapper.get_repo_map()
+            for file, symbols in repo_map["symbols"].items():
+                for sym in symbols:
+                    index.setdefault(sym["name"], []).append((file, sym))
+            self._symbol_index = index
+        return self._symbol_index
+
+    @staticmethod
+    def _dump_json_bytes(data: Any) -> bytes:
+        """Serialize to indented JSON bytes, via orjson when installed."""
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        import json
+
+        return json.dumps(data, indent=2).encode("utf-8")
+
     def write_index(self, file_path: str) -> None:
         """
         Writes the full repo index (file tree and symbols) to a JSON file.
+
+        Symbols are streamed per file rather than materialized into one dict
+        first, so peak memory stays at one file's worth of symbols.
         Args:
             file_path (str): The path to the output file.
         """
-        import json
-
-        with open(file_path, "w") as f:
-            json.dump(self.index(), f, indent=2)
+        tree_bytes = self._dump_json_bytes(self.get_file_tree())
+        with open(file_path, "wb") as f:
+            f.write(b'{\n"file_tree": ')  # legacy key
+            f.write(tree_bytes)
+            f.write(b',\n"files": ')  # preferred
+            f.write(tree_bytes)
+            f.write(b',\n"symbols": {')
+            first = True
+            for file, symbols in self.mapper.iter_symbols():
+                if not first:
+                    f.write(b",\n")
+                f.write(self._dump_json_bytes(file))
+                f.write(b": ")
+                f.write(self._dump_json_bytes(symbols))
+                first = False
+            f.write(b"}\n}")
 
     def write_symbols(self, file_path: str, symbols: Optional[list] = None) -> None:
         """
         Writes all extracted symbols (or provided symbols) to a JSON file.
+
+        When extracting from the repo, symbols are streamed to disk one file's
+        worth at a time rather than flattened into a single in-memory list.
         Args:
             file_path (str): The path to the output file.
             symbols (Optional[list]): List of symbol dicts. If None, extracts all symbols in the repo.
         """
-        import json
-
-        syms = (
-            symbols if symbols is not None else [s for file_syms in self.index()["symbols"].values() for s in file_syms]
-        )
-        with open(file_path, "w") as f:
-            json.dump(syms, f, indent=2)
+        if symbols is not None:
+            with open(file_path, "wb") as f:
+                f.write(self._dump_json_bytes(symbols))
+            return
+
+        with open(file_path, "wb") as f:
+            f.write(b"[\n")
+            first = True
+            for _file, file_syms in self.mapper.iter_symbols():
+                for sym in file_syms:
+                    if not first:
+                        f.write(b",\n")
+                    f.write(self._dump_json_bytes(sym))
+                    first = False
+            f.write(b"\n]")
 
     def write_file_tree(self, file_path: str) -> None:
         """
@@ -534,10 +871,8 @@ class Repository:
         Args:
             file_path (str): The path to the output file.
         """
-        import json
-
-        with open(file_path, "w") as f:
-            json.dump(self.get_file_tree(), f, indent=2)
+        with open(file_path, "wb") as f:
+            f.write(self._dump_json_bytes(self.get_file_tree()))
 
     def write_symbol_usages(self, symbol_name: str, file_path: str, symbol_type: Optional[str] = None) -> None:
         """
@@ -547,11 +882,9 @@ class Repository:
             file_path (str): The path to the output file.
             symbol_type (Optional[str]): Optionally restrict to a symbol type.
         """
-        import json
-
         usages = self.find_symbol_usages(symbol_name, symbol_type)
-        with open(file_path, "w") as f:
-            json.dump(usages, f, indent=2)
+        with open(file_path, "wb") as f:
+            f.write(self._dump_json_bytes(usages))
 
     def get_abs_path(self, relative_path: str) -> str:
         """
@@ -564,9 +897,13 @@ class Repository:
             The absolute path as a string.
         """
         # Return a canonical absolute path for a file inside the repository.
-        # We purposefully call `.resolve()` *after* joining with `self.local_path` so that
-        # the repository root itself keeps its original symlink form (important for
-        # tests that compare the root path), while individual file paths are resolved to
-        # their real locations on disk. This yields stable, non-symlinked paths that
-        # downstream tools (and tests) expect.
-        return str((self.local_path / relative_path).resolve())
+        # `self.local_path` itself keeps its original symlink form (important for
+        # tests that compare the root path), while returned paths are resolved to
+        # their real locations on disk. Resolving the root does a full realpath
+        # walk (one lstat per component), so it is computed once and cached;
+        # per-call work is then a realpath over the relative part only, which
+        # still resolves symlinks anywhere in the path (not just the leaf)
+        # without Path.resolve()'s per-component object churn.
+        if self._resolved_root is None:
+            self._resolved_root = self.local_path.resolve()
+        return os.path.realpath(os.path.join(str(self._resolved_root), relative_path))
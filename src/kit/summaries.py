@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Protocol, Union, ru
 
 import tiktoken
 
+from ._thinking import strip_thinking_tokens as _strip_thinking_tokens
+
 
 # Define a Protocol for LLM clients to help with type checking
 @runtime_checkable
@@ -120,38 +122,6 @@ MAX_FILE_SUMMARIZE_CHARS = 25000  # Max characters for file content in summarize
 OPENAI_MAX_PROMPT_TOKENS = 15000  # Max tokens for the prompt to OpenAI
 
 
-def _strip_thinking_tokens(response: str) -> str:
-    """
-    Strip thinking tokens from LLM responses.
-
-    Reasoning models like DeepSeek R1 include <think>...</think> tags
-    that show internal reasoning but aren't meant for end users.
-    """
-    if not response:
-        return response
-
-    import re
-
-    # Common thinking token patterns used by reasoning models
-    patterns = [
-        r"<think>.*?</think>",  # DeepSeek R1, others
-        r"<thinking>.*?</thinking>",  # Alternative format
-        r"<thought>.*?</thought>",  # Another variant
-        r"<reason>.*?</reason>",  # Reasoning blocks
-    ]
-
-    cleaned = response
-    for pattern in patterns:
-        # Use DOTALL flag to match across newlines
-        cleaned = re.sub(pattern, "", cleaned, flags=re.DOTALL | re.IGNORECASE)
-
-    # Clean up extra whitespace left by removal
-    cleaned = re.sub(r"\n\s*\n\s*\n", "\n\n", cleaned)  # Multiple blank lines
-    cleaned = cleaned.strip()
-
-    return cleaned
-
-
 class Summarizer:
     """Provides methods to summarize code using a configured LLM."""
 
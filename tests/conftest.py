@@ -1,6 +1,25 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(scope="session")
+def cli_app():
+    """Typer application, imported lazily so tests that never exercise the
+    CLI don't pay for registering its commands at collection time."""
+    from kit.cli import app
+
+    return app
+
+
+@pytest.fixture(scope="session")
+def cli_runner():
+    """Session-wide CliRunner; it keeps no state between invocations."""
+    from typer.testing import CliRunner
+
+    return CliRunner()
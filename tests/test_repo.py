@@ -1,4 +1,5 @@
 import os
+import subprocess
 import tempfile
 
 import pytest
@@ -127,3 +128,69 @@ def test_repo_get_file_content():
         # Test 4: Attempt to read content from a directory (should also fail)
         with pytest.raises(IOError):  # Or perhaps FileNotFoundError or IsADirectoryError, adjust as per actual behavior
             repository.get_file_content("dir1")
+
+
+def test_repo_read_files_bulk():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        files = {
+            "a.py": b"a = 1\n",
+            "dir1/b.py": b"b = 2\n",
+        }
+        for relpath, contents in files.items():
+            path = os.path.join(tmpdir, relpath)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(contents)
+
+        repository = Repository(tmpdir)
+
+        # Unreadable paths are skipped rather than raising
+        contents = repository.read_files_bulk(["a.py", "dir1/b.py", "missing.py"])
+        assert contents == files
+
+
+def test_repo_extract_symbols_parallel_matches_serial():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with open(os.path.join(tmpdir, "one.py"), "w") as f:
+            f.write("class Foo:\n    def bar(self): pass\n")
+        with open(os.path.join(tmpdir, "two.py"), "w") as f:
+            f.write("def baz(): pass\n")
+
+        repository = Repository(tmpdir)
+        serial = repository.extract_symbols()
+        parallel = repository.extract_symbols_parallel(num_processes=2)
+
+        # Same symbols, possibly in a different order than the serial scan
+        as_pairs = lambda symbols: sorted((s["name"], s["type"]) for s in symbols)  # noqa: E731
+        assert as_pairs(parallel) == as_pairs(serial)
+        names = {s["name"] for s in parallel}
+        assert {"Foo", "bar", "baz"} <= names
+
+
+def test_repo_get_file_content_at_ref():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        subprocess.run(["git", "init", "-q"], cwd=tmpdir, check=True)
+        subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=tmpdir, check=True)
+        subprocess.run(["git", "config", "user.name", "Test"], cwd=tmpdir, check=True)
+        with open(os.path.join(tmpdir, "a.py"), "w") as f:
+            f.write("committed = True\n")
+        subprocess.run(["git", "add", "a.py"], cwd=tmpdir, check=True)
+        subprocess.run(["git", "commit", "-q", "-m", "initial"], cwd=tmpdir, check=True)
+
+        repository = Repository(tmpdir)
+
+        # Working-tree edits must not leak into reads pinned to a ref
+        with open(os.path.join(tmpdir, "a.py"), "w") as f:
+            f.write("modified = True\n")
+        assert repository.get_file_content_at_ref("HEAD", "a.py") == "committed = True\n"
+
+        # A path missing at the ref raises, like get_file_content does
+        with pytest.raises(FileNotFoundError):
+            repository.get_file_content_at_ref("HEAD", "missing.py")
+
+        # ...and the miss must not desync the batch stream for later reads
+        assert repository.get_file_content_at_ref("HEAD", "a.py") == "committed = True\n"
+
+        # close() tears down the co-process; the next read respawns it
+        repository.close()
+        assert repository.get_file_content_at_ref("HEAD", "a.py") == "committed = True\n"